@@ -4,7 +4,9 @@ import numpy as np
 from sklearn.metrics import mean_absolute_error, mean_squared_error
 from math import sqrt
 from datetime import timedelta
-from AI.predict_future import predict_future
+import time
+from AI.predict_future import predict_future, predict_future_custom
+from AI.forecast_engines import FORECAST_ENGINES, get_forecast_engine
 
 def backtest_model(ticker, train_period="5y", test_days=30):
     """
@@ -45,17 +47,7 @@ def backtest_model(ticker, train_period="5y", test_days=30):
             predictions.append(result['forecast'][-1]['yhat'])  # Get the forecasted price
 
         # Calculate backtest metrics
-        mae = mean_absolute_error(actual_prices, predictions)
-        mse = mean_squared_error(actual_prices, predictions)
-        rmse = sqrt(mse)
-        mape = np.mean(np.abs((actual_prices - predictions) / actual_prices)) * 100
-
-        metrics = {
-            "MAE": mae,
-            "MSE": mse,
-            "RMSE": rmse,
-            "MAPE": mape
-        }
+        metrics = calculate_metrics(actual_prices, predictions)
 
         # Prepare comparison data for plotting
         comparison_df = pd.DataFrame({
@@ -75,3 +67,71 @@ def backtest_model(ticker, train_period="5y", test_days=30):
     except Exception as e:
         print(f"Error in backtesting: {str(e)}")
         raise Exception(f"Error in backtesting: {str(e)}")
+
+def calculate_metrics(actual_prices, predictions):
+    """Calculate forecast error metrics for aligned actual and predicted prices."""
+    actual_prices = np.ravel(np.asarray(actual_prices, dtype=float))
+    predictions = np.ravel(np.asarray(predictions, dtype=float))
+    mse = mean_squared_error(actual_prices, predictions)
+
+    return {
+        "MAE": mean_absolute_error(actual_prices, predictions),
+        "MSE": mse,
+        "RMSE": sqrt(mse),
+        "MAPE": np.mean(np.abs((actual_prices - predictions) / actual_prices)) * 100
+    }
+
+def compare_engines(ticker, train_period="5y", test_days=30, engines=None):
+    """
+    Compare forecast engines on accuracy and cost over the same hold-out window.
+
+    Each engine is fitted once on data up to the hold-out window and forecasts
+    all test_days trading days in one shot.
+
+    Parameters:
+    - ticker (str): Stock ticker symbol
+    - train_period (str): Period to fetch historical data for training
+    - test_days (int): Number of trading days held out for evaluation
+    - engines (list): Engine names to compare, defaults to every registered engine
+
+    Returns:
+    - dict: {engine: metrics plus 'coverage', 'fit_seconds' and any engine timings} or {engine: {'error': str}}
+    """
+    try:
+        stock_data = yf.download(ticker, period=train_period)
+        stock_data = stock_data.reset_index()
+
+        if stock_data.empty:
+            raise ValueError(f"No data found for ticker {ticker}")
+
+        train_data = stock_data.iloc[:len(stock_data) - test_days]
+        test_data = stock_data.iloc[len(stock_data) - test_days:]
+        actual_prices = np.ravel(test_data['Close'].values)
+
+        comparison = {}
+        for name in engines or list(FORECAST_ENGINES):
+            try:
+                engine = get_forecast_engine(name)
+                start = time.perf_counter()
+                result = engine['predict_custom'](train_data, days_ahead=test_days)
+                fit_seconds = time.perf_counter() - start
+                forecast = result['forecast']
+
+                n_points = min(len(forecast), len(actual_prices))
+                actual = actual_prices[:n_points]
+                lower = np.array([point['yhat_lower'] for point in forecast[:n_points]])
+                upper = np.array([point['yhat_upper'] for point in forecast[:n_points]])
+
+                metrics = calculate_metrics(actual, [point['yhat'] for point in forecast[:n_points]])
+                metrics['coverage'] = float(np.mean((actual >= lower) & (actual <= upper)))
+                metrics['fit_seconds'] = fit_seconds
+                metrics.update(result.get('timings', {}))
+                comparison[name] = metrics
+            except Exception as e:
+                comparison[name] = {'error': str(e)}
+
+        return comparison
+
+    except Exception as e:
+        print(f"Error in engine comparison: {str(e)}")
+        raise Exception(f"Error in engine comparison: {str(e)}")
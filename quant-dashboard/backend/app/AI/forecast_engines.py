@@ -0,0 +1,44 @@
+from functools import partial
+from AI.predict_future import predict_future, predict_future_custom
+from AI.predict_future_advanced import predict_future_advanced_parallel, predict_future_advanced_custom
+from AI.predict_future_fast import predict_future_fast, predict_future_fast_custom
+
+# Every engine returns {'forecast': [{ds, yhat, yhat_lower, yhat_upper}]}.
+# 'predict' takes (ticker, days_ahead); 'predict_custom' takes (data, days_ahead)
+# and forecasts trading days so backtests can line results up with actual closes.
+FORECAST_ENGINES = {
+    'prophet': {
+        'predict': predict_future,
+        'predict_custom': partial(predict_future_custom, freq='B')
+    },
+    'lstm': {
+        'predict': predict_future_advanced_parallel,
+        'predict_custom': predict_future_advanced_custom
+    },
+    'lstm_mc': {
+        'predict': partial(predict_future_advanced_parallel, uncertainty='mc_dropout'),
+        'predict_custom': partial(predict_future_advanced_custom, uncertainty='mc_dropout')
+    },
+    'ets': {
+        'predict': partial(predict_future_fast, method='ets'),
+        'predict_custom': partial(predict_future_fast_custom, method='ets')
+    },
+    'arima': {
+        'predict': partial(predict_future_fast, method='arima'),
+        'predict_custom': partial(predict_future_fast_custom, method='arima')
+    },
+    'linear': {
+        'predict': partial(predict_future_fast, method='linear'),
+        'predict_custom': partial(predict_future_fast_custom, method='linear')
+    }
+}
+
+def get_forecast_engine(name: str) -> dict:
+    """Look up a forecast engine by name."""
+    if name not in FORECAST_ENGINES:
+        raise ValueError(f"Unknown forecast engine '{name}'. Available engines: {', '.join(FORECAST_ENGINES)}")
+    return FORECAST_ENGINES[name]
+
+def run_forecast(engine: str, ticker: str, days_ahead: int = 30):
+    """Run the named forecast engine for a single ticker."""
+    return get_forecast_engine(engine)['predict'](ticker, days_ahead)
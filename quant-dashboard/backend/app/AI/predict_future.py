@@ -1,6 +1,7 @@
 import yfinance as yf
 import pandas as pd
 from prophet import Prophet
+from resource_manager import resources, children_cpu_seconds
 
 def predict_future(ticker: str, days_ahead: int = 30):
     """Predict future prices using AI model."""
@@ -15,6 +16,13 @@ def predict_future(ticker: str, days_ahead: int = 30):
         print("\nData types:")
         print(data.dtypes)
         
+        return predict_future_custom(data, days_ahead)
+    except Exception as e:
+        raise Exception(f"Error in AI prediction: {str(e)}")
+
+def predict_future_custom(data: pd.DataFrame, days_ahead: int = 30, freq: str = 'D'):
+    """Predict future prices from an already downloaded frame with 'Date' and 'Close' columns."""
+    try:
         # Prepare data for Prophet
         prophet_df = pd.DataFrame()
         # Convert datetime to timezone-naive
@@ -33,13 +41,16 @@ def predict_future(ticker: str, days_ahead: int = 30):
         if prophet_df.empty:
             raise ValueError("No valid data available for prediction after cleaning.")
         
-        # Initialize and fit Prophet model
-        model = Prophet(daily_seasonality=True)
-        model.fit(prophet_df)
-        
-        # Create future dates for prediction
-        future = model.make_future_dataframe(periods=days_ahead)
-        forecast = model.predict(future)
+        with resources.job('prophet') as budget:
+            # Initialize and fit Prophet model; cmdstanpy runs the fit in a separate Stan process
+            children_start = children_cpu_seconds()
+            model = Prophet(daily_seasonality=True)
+            model.fit(prophet_df)
+            budget.add_cpu(children_cpu_seconds() - children_start)
+            
+            # Create future dates for prediction
+            future = model.make_future_dataframe(periods=days_ahead, freq=freq)
+            forecast = model.predict(future)
         
         # Extract forecast data
         forecast_data = forecast[['ds', 'yhat', 'yhat_lower', 'yhat_upper']].tail(days_ahead)
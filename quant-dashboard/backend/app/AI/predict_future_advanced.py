@@ -6,14 +6,46 @@ from tensorflow.keras.models import Sequential
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.callbacks import EarlyStopping
 from tensorflow.keras.optimizers import Adam
-from multiprocessing import Pool
+import time
+from resource_manager import (resources, worker_context, configure_process_threads, check_process_threads,
+                              process_cpu_seconds)
 
-def predict_future_advanced_parallel(ticker: str, days_ahead: int = 30):
+UNCERTAINTY_MODES = ('ensemble', 'mc_dropout')
+# Sampled forward passes for mc_dropout: the default is what precompute stores,
+# and requests are clamped to [MIN, MAX] so the interval is defined and bounded in cost
+DEFAULT_MC_SAMPLES = 50
+MIN_MC_SAMPLES = 2
+MAX_MC_SAMPLES = 500
+
+def clamp_mc_samples(mc_samples) -> int:
+    return min(max(int(mc_samples), MIN_MC_SAMPLES), MAX_MC_SAMPLES)
+
+def predict_future_advanced_parallel(ticker: str, days_ahead: int = 30, uncertainty: str = 'ensemble',
+                                     mc_samples: int = DEFAULT_MC_SAMPLES):
     try:
         # Fetch and prepare data (same as before)
         data = yf.download(ticker, period='5y')
         data = data.reset_index()
         
+        return predict_future_advanced_custom(data, days_ahead, uncertainty, mc_samples)
+    except Exception as e:
+        raise Exception(f"Error in advanced AI prediction: {str(e)}")
+
+def predict_future_advanced_custom(data: pd.DataFrame, days_ahead: int = 30, uncertainty: str = 'ensemble',
+                                   mc_samples: int = DEFAULT_MC_SAMPLES):
+    """
+    Run the LSTM forecast on an already downloaded frame with a 'Date' column.
+
+    uncertainty='ensemble' trains five models and uses their spread for the interval;
+    uncertainty='mc_dropout' trains one model and samples mc_samples forward passes
+    with dropout active (clamped to MIN_MC_SAMPLES..MAX_MC_SAMPLES).
+    """
+    try:
+        if uncertainty not in UNCERTAINTY_MODES:
+            raise ValueError(f"Unknown uncertainty mode '{uncertainty}'. Available modes: {', '.join(UNCERTAINTY_MODES)}")
+        mc_samples = clamp_mc_samples(mc_samples)
+        data = data.copy()
+        
         # Prepare feature engineering, technical indicators, scaling, etc.
         data['Date'] = pd.to_datetime(data['Date'])
         data.set_index('Date', inplace=True)
@@ -37,26 +69,40 @@ def predict_future_advanced_parallel(ticker: str, days_ahead: int = 30):
             
         x_train, y_train = np.array(x_train), np.array(y_train)
         
-        # Train models in parallel
-        n_models = 5
-        with Pool(n_models) as pool:
-            results = pool.starmap(train_lstm_model, [(x_train, y_train, x_train.shape[1:]) for _ in range(n_models)])
-        
-        # Collect models and make predictions
-        predictions = []
         test_data = scaled_data[-prediction_days:]
         current_batch = test_data.reshape((1, prediction_days, len(features)))
         
-        for model in results:
-            model_predictions = []
-            current_batch_model = current_batch.copy()
-            for _ in range(days_ahead):
-                pred = model.predict(current_batch_model, verbose=0)[0]
-                model_predictions.append(pred)
-                new_row = current_batch_model[0, -1:].copy()
-                new_row[0, 0] = pred  # Update Close price
-                current_batch_model = np.append(current_batch_model[:, 1:], [new_row], axis=1)
-            predictions.append(model_predictions)
+        # Training and inference both run in spawned workers, so TensorFlow uses the job's thread budget
+        if uncertainty == 'mc_dropout':
+            with resources.job('lstm_mc') as budget:
+                pool_start = time.perf_counter()
+                with worker_context.Pool(1, initializer=configure_process_threads, initargs=(budget.cores,)) as pool:
+                    results = [pool.apply(_mc_dropout_worker, (x_train, y_train, current_batch, days_ahead, mc_samples))]
+                budget.add_cpu(results[0]['cpu_seconds'])
+                wall_seconds = time.perf_counter() - pool_start
+            predictions = results[0]['predictions']
+        else:
+            with resources.job('lstm') as budget:
+                pool_start = time.perf_counter()
+                # Train models in parallel, splitting the core budget across the workers
+                n_models = 5
+                n_workers = min(n_models, budget.cores)
+                with worker_context.Pool(n_workers, initializer=configure_process_threads,
+                                         initargs=(budget.cores // n_workers,)) as pool:
+                    results = pool.starmap(_ensemble_worker,
+                                           [(x_train, y_train, current_batch, days_ahead) for _ in range(n_models)])
+                budget.add_cpu(sum(result['cpu_seconds'] for result in results))
+                wall_seconds = time.perf_counter() - pool_start
+            predictions = [result['predictions'] for result in results]
+        
+        # Training and inference are summed over the models, so the ensemble shows its full cost;
+        # wall_seconds is the elapsed time of the worker pool (excluding queueing for cores)
+        timings = {
+            'train_seconds': sum(result['train_seconds'] for result in results),
+            'inference_seconds': sum(result['inference_seconds'] for result in results),
+            'cpu_seconds': sum(result['cpu_seconds'] for result in results),
+            'wall_seconds': wall_seconds
+        }
         
         # Calculate mean and confidence intervals
         predictions = np.array(predictions)
@@ -86,12 +132,62 @@ def predict_future_advanced_parallel(ticker: str, days_ahead: int = 30):
         })
         
         return {
-            'forecast': forecast_data.to_dict('records')
+            'forecast': forecast_data.to_dict('records'),
+            'timings': timings
         }
         
     except Exception as e:
         raise Exception(f"Error in advanced AI prediction: {str(e)}")
 
+def _ensemble_worker(x_train, y_train, current_batch, days_ahead):
+    """Train one ensemble model and forecast recursively; runs in a pool worker."""
+    check_process_threads()
+    cpu_start = process_cpu_seconds()
+    train_start = time.perf_counter()
+    model = train_lstm_model(x_train, y_train, x_train.shape[1:])
+    inference_start = time.perf_counter()
+    predictions = []
+    current_batch = current_batch.copy()
+    for _ in range(days_ahead):
+        pred = model.predict(current_batch, verbose=0)[0]
+        predictions.append(pred)
+        new_row = current_batch[0, -1:].copy()
+        new_row[0, 0] = pred  # Update Close price
+        current_batch = np.append(current_batch[:, 1:], [new_row], axis=1)
+    return {
+        'predictions': predictions,
+        'train_seconds': inference_start - train_start,
+        'inference_seconds': time.perf_counter() - inference_start,
+        'cpu_seconds': process_cpu_seconds() - cpu_start
+    }
+
+def _mc_dropout_worker(x_train, y_train, current_batch, days_ahead, mc_samples):
+    """Train one model and sample MC dropout paths; runs in a pool worker."""
+    check_process_threads()
+    cpu_start = process_cpu_seconds()
+    train_start = time.perf_counter()
+    model = train_lstm_model(x_train, y_train, x_train.shape[1:])
+    inference_start = time.perf_counter()
+    predictions = mc_dropout_forecast(model, current_batch, days_ahead, mc_samples)
+    return {
+        'predictions': predictions,
+        'train_seconds': inference_start - train_start,
+        'inference_seconds': time.perf_counter() - inference_start,
+        'cpu_seconds': process_cpu_seconds() - cpu_start
+    }
+
+def mc_dropout_forecast(model, current_batch, days_ahead, n_samples):
+    """Recursive forecast with dropout active; all sample paths share one forward pass per day."""
+    batch = np.repeat(current_batch, n_samples, axis=0)
+    predictions = []
+    for _ in range(days_ahead):
+        pred = model(batch, training=True).numpy()
+        predictions.append(pred)
+        new_row = batch[:, -1:].copy()
+        new_row[:, 0, 0] = pred[:, 0]  # Update Close price of every sample path
+        batch = np.concatenate([batch[:, 1:], new_row], axis=1)
+    return np.stack(predictions, axis=1)
+
 def calculate_rsi(prices, periods=14):
     delta = prices.diff()
     gain = (delta.where(delta > 0, 0)).rolling(window=periods).mean()
@@ -0,0 +1,208 @@
+import yfinance as yf
+import pandas as pd
+import numpy as np
+
+FAST_METHODS = ('ets', 'arima', 'linear')
+FIT_WINDOW = 504        # ~2 years of trading days
+LINEAR_WINDOW = 120     # Linear trend only looks at the recent regime
+MIN_OBSERVATIONS = 60
+Z_SCORE = 1.96          # 95% prediction interval
+
+# Holt smoothing parameter grid searched for every ticker at once
+ETS_ALPHAS = np.array([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 0.99])
+ETS_BETAS = np.array([0.01, 0.05, 0.1, 0.2])
+
+def predict_future_fast(ticker: str, days_ahead: int = 30, method: str = 'ets'):
+    """Predict future prices using a fast statistical model (ETS, ARIMA or linear trend)."""
+    try:
+        data = yf.download(ticker, period='2y')
+        data = data.reset_index()
+        return predict_future_fast_custom(data, days_ahead, method)
+    except Exception as e:
+        raise Exception(f"Error in fast AI prediction: {str(e)}")
+
+def predict_future_fast_custom(data: pd.DataFrame, days_ahead: int = 30, method: str = 'ets'):
+    """Predict future prices from an already downloaded frame with 'Date' and 'Close' columns."""
+    close = data['Close']
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    closes = pd.DataFrame({'Close': close.values}, index=pd.to_datetime(data['Date']))
+
+    result = forecast_prices(closes, days_ahead, method)['Close']
+    if 'error' in result:
+        raise ValueError(result['error'])
+    return result
+
+def predict_future_fast_batch(tickers, days_ahead: int = 30, method: str = 'ets', period: str = '2y'):
+    """
+    Forecast many tickers with a single download and a single vectorized fit.
+
+    Returns:
+    - dict: {ticker: {'forecast': [...]}} or {ticker: {'error': str}} per ticker
+    """
+    try:
+        tickers = list(tickers)
+        data = yf.download(tickers, period=period, group_by='column')
+        closes = data['Close']
+        if isinstance(closes, pd.Series):
+            closes = closes.to_frame(tickers[0])
+        return forecast_prices(closes, days_ahead, method)
+    except Exception as e:
+        raise Exception(f"Error in fast batch prediction: {str(e)}")
+
+def forecast_prices(closes: pd.DataFrame, days_ahead: int = 30, method: str = 'ets'):
+    """Fit the selected model to every column of a close price frame in one pass."""
+    if method not in FAST_METHODS:
+        raise ValueError(f"Unknown fast forecast method '{method}'. Available methods: {', '.join(FAST_METHODS)}")
+    if days_ahead < 1:
+        raise ValueError(f"days_ahead must be at least 1, got {days_ahead}")
+
+    results = {}
+    histories = {}
+    prices = closes.to_numpy(dtype=float)
+    valid = np.isfinite(prices) & (prices > 0)
+    for i, column in enumerate(closes.columns):
+        rows = np.flatnonzero(valid[:, i])
+        if len(rows) < MIN_OBSERVATIONS:
+            results[column] = {'error': f"Not enough price history for {column} ({len(rows)} rows)"}
+            continue
+        rows = rows[-FIT_WINDOW:]
+        histories[column] = (prices[rows, i], closes.index[rows[-1]])
+
+    if not histories:
+        return results
+
+    # Fit tickers with the same history length as one matrix, so a recently
+    # listed ticker never shortens the fitting window of the others
+    groups = {}
+    for column, (values, _) in histories.items():
+        groups.setdefault(len(values), []).append(column)
+
+    future_dates = {}
+    for columns in groups.values():
+        log_prices = np.log(np.column_stack([histories[column][0] for column in columns]))
+
+        if method == 'ets':
+            mean, var = _fit_ets(log_prices, days_ahead)
+        elif method == 'arima':
+            mean, var = _fit_arima(log_prices, days_ahead)
+        else:
+            mean, var = _fit_linear(log_prices[-LINEAR_WINDOW:], days_ahead)
+
+        # Transform and round every ticker at once, then transpose to one row per ticker
+        std = np.sqrt(np.maximum(var, 0))
+        yhat = np.exp(mean).round(2).T.tolist()
+        lower = np.exp(mean - Z_SCORE * std).round(2).T.tolist()
+        upper = np.exp(mean + Z_SCORE * std).round(2).T.tolist()
+
+        for i, column in enumerate(columns):
+            last_date = pd.Timestamp(histories[column][1])
+            if last_date not in future_dates:
+                future_dates[last_date] = pd.date_range(
+                    start=last_date + pd.Timedelta(days=1),
+                    periods=days_ahead,
+                    freq='B'
+                ).strftime('%Y-%m-%d').tolist()
+            results[column] = {'forecast': [
+                {'ds': ds, 'yhat': point, 'yhat_lower': low, 'yhat_upper': high}
+                for ds, point, low, high in zip(future_dates[last_date], yhat[i], lower[i], upper[i])
+            ]}
+
+    return results
+
+def _fit_ets(y, days_ahead):
+    """Holt's additive trend model, grid searched over (alpha, beta) for all columns at once."""
+    alpha_grid, beta_grid = np.meshgrid(ETS_ALPHAS, ETS_BETAS, indexing='ij')
+    alpha = alpha_grid.reshape(-1, 1)
+    beta = beta_grid.reshape(-1, 1)
+    n_grid, n_series = len(alpha), y.shape[1]
+
+    # State arrays have shape (grid, series)
+    level = np.repeat(y[:1], n_grid, axis=0)
+    trend = np.repeat(y[1:2] - y[:1], n_grid, axis=0)
+    sse = np.zeros((n_grid, n_series))
+    for obs in y[1:]:
+        error = obs - (level + trend)
+        sse += error ** 2
+        level = level + trend + alpha * error
+        trend = trend + alpha * beta * error
+
+    best = sse.argmin(axis=0)
+    columns = np.arange(n_series)
+    level, trend = level[best, columns], trend[best, columns]
+    alpha, beta = alpha[best, 0], beta[best, 0]
+    sigma2 = sse[best, columns] / (len(y) - 1)
+
+    steps = np.arange(1, days_ahead + 1).reshape(-1, 1)
+    mean = level + steps * trend
+    # Var(h) = sigma^2 * (1 + sum_{j<h} alpha^2 (1 + j*beta)^2)
+    weights = (alpha * (1 + (steps[:-1]) * beta)) ** 2
+    var = sigma2 * (1 + np.vstack([np.zeros((1, n_series)), np.cumsum(weights, axis=0)]))
+    return mean, var
+
+def _fit_arima(y, days_ahead):
+    """ARIMA(1,1,0) with drift on log prices, fitted by closed-form least squares per column."""
+    returns = np.diff(y, axis=0)
+    x, z = returns[:-1], returns[1:]
+    x_mean, z_mean = x.mean(axis=0), z.mean(axis=0)
+    denom = ((x - x_mean) ** 2).sum(axis=0)
+    phi = ((x - x_mean) * (z - z_mean)).sum(axis=0) / np.where(denom > 0, denom, 1.0)
+    phi = np.clip(phi, -0.99, 0.99)
+    const = z_mean - phi * x_mean
+    resid = z - (const + phi * x)
+    sigma2 = (resid ** 2).sum(axis=0) / max(len(z) - 2, 1)
+
+    forecast_returns = []
+    previous = returns[-1]
+    for _ in range(days_ahead):
+        previous = const + phi * previous
+        forecast_returns.append(previous)
+    mean = y[-1] + np.cumsum(forecast_returns, axis=0)
+
+    # Integrated AR(1) psi weights: psi_j = sum_{i<=j} phi^i
+    psi = np.cumsum(phi ** np.arange(days_ahead).reshape(-1, 1), axis=0)
+    var = sigma2 * np.cumsum(psi ** 2, axis=0)
+    return mean, var
+
+def _fit_linear(y, days_ahead):
+    """
+    Least squares trend line fitted to every column at once, with AR(1) errors.
+
+    Residuals around a trend fitted to prices are strongly autocorrelated, so the
+    forecast starts from the last residual and decays back to the line. The
+    residual variance grows with the horizon like a random walk (the lag-1
+    estimate is biased low near a unit root), and the line's own uncertainty is
+    inflated for the autocorrelated errors.
+    """
+    n_obs = len(y)
+    t = np.arange(n_obs, dtype=float).reshape(-1, 1)
+    t_mean = t.mean()
+    sxx = ((t - t_mean) ** 2).sum()
+    y_mean = y.mean(axis=0)
+    slope = ((t - t_mean) * (y - y_mean)).sum(axis=0) / sxx
+    intercept = y_mean - slope * t_mean
+    resid = y - (intercept + slope * t)
+
+    # Lag-1 autocorrelation of the residuals and the variance of their innovations
+    phi = (resid[1:] * resid[:-1]).sum(axis=0) / np.maximum((resid[:-1] ** 2).sum(axis=0), 1e-12)
+    phi = np.clip(phi, 0, 0.999)
+    innovations = resid[1:] - phi * resid[:-1]
+    sigma2 = (innovations ** 2).sum(axis=0) / (n_obs - 3)
+
+    h = np.arange(1, days_ahead + 1, dtype=float).reshape(-1, 1)
+    future_t = n_obs - 1 + h
+    mean = intercept + slope * future_t + phi ** h * resid[-1]
+    resid_var = sigma2 * h
+    # Uncertainty of the fitted line itself, scaled for autocorrelated errors
+    line_var = sigma2 / np.maximum(1 - phi, 1e-3) ** 2 * (1 / n_obs + (future_t - t_mean) ** 2 / sxx)
+    return mean, resid_var + line_var
+
+# Test code
+if __name__ == "__main__":
+    try:
+        ticker = "VAS.AX"
+        print(f"Predicting future prices for {ticker}...")
+        result = predict_future_fast(ticker)
+        print("\nAI Prediction Result:", result)
+    except Exception as e:
+        print("Error in prediction:", e)
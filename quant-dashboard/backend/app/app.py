@@ -1,14 +1,39 @@
+import os
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 from main_strategy import EnhancedQuantStrategy
-from AI.predict_future import predict_future
-from AI.predict_future_advanced import predict_future_advanced_parallel
-from AI.backtest import backtest_model
+from AI.predict_future_advanced import (predict_future_advanced_parallel, clamp_mc_samples, UNCERTAINTY_MODES,
+                                        DEFAULT_MC_SAMPLES)
+from AI.forecast_engines import run_forecast, FORECAST_ENGINES
+from AI.backtest import backtest_model, compare_engines
 from summary_generator import AnalysisSummary
+from precompute import PrecomputeStore, PrecomputeScheduler, cached_recommendation
+from precompute_config import load_config
+from resource_manager import resources, limit_blas_threads
+from snapshots import SnapshotStore
 
 app = Flask(__name__)
 CORS(app)
 
+# Request threads share this process, so keep BLAS single-threaded here; heavy
+# jobs get their cores from the resource manager, and LSTM training and inference
+# run in worker processes that apply the job's TensorFlow thread budget
+limit_blas_threads(1)
+
+# Recent response versions, so clients sending a cursor only receive what changed
+snapshots = SnapshotStore()
+
+# Results from the after-close precompute pipeline; requests fall back to live computation
+precompute_config = load_config()
+precompute_store = PrecomputeStore(precompute_config)
+
+def get_market_data(ticker):
+    """Default-target recommendation for a ticker, served from the precompute store when fresh."""
+    market_data = precompute_store.lookup_analysis(ticker)
+    if market_data is None:
+        market_data = EnhancedQuantStrategy(ticker=ticker).calculate_recommendation()
+    return market_data
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze():
     data = request.get_json()
@@ -17,13 +42,15 @@ def analyze():
     total_target = data.get('total_target', 10000)
 
     try:
-        strategy = EnhancedQuantStrategy(
-            ticker=ticker,
-            monthly_target=monthly_target,
-            total_target=total_target
-        )
-        results = strategy.calculate_recommendation()
-        return jsonify(results)
+        results = cached_recommendation(precompute_store, ticker, monthly_target, total_target)
+        if results is None:
+            strategy = EnhancedQuantStrategy(
+                ticker=ticker,
+                monthly_target=monthly_target,
+                total_target=total_target
+            )
+            results = strategy.calculate_recommendation()
+        return jsonify(snapshots.respond(request.path, data, results))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -31,10 +58,18 @@ def analyze():
 def predict():
     data = request.get_json()
     ticker = data.get("ticker", "VAS.AX")
+    engine = data.get("engine", "prophet")
+    days_ahead = data.get("days_ahead", 30)
+    if engine not in FORECAST_ENGINES:
+        return jsonify({'error': f"Unknown forecast engine '{engine}'. "
+                                 f"Available engines: {', '.join(FORECAST_ENGINES)}"}), 400
+    if isinstance(days_ahead, bool) or not isinstance(days_ahead, int) or days_ahead < 1:
+        return jsonify({'error': f"days_ahead must be a positive integer, got {days_ahead!r}"}), 400
     
     try:
-        market_data = EnhancedQuantStrategy(ticker=ticker).calculate_recommendation()
-        prediction = predict_future(ticker)
+        market_data = get_market_data(ticker)
+        prediction = (precompute_store.lookup_forecast(ticker, engine, days_ahead)
+                      or run_forecast(engine, ticker, days_ahead))
         
         # Generate summary
         summary = AnalysisSummary.generate_combined_summary(
@@ -42,10 +77,10 @@ def predict():
             ai_prediction=prediction['forecast']
         )
         
-        return jsonify({
+        return jsonify(snapshots.respond(request.path, data, {
             'forecast': prediction['forecast'],
             'summary': summary
-        })
+        }))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -54,10 +89,23 @@ def predict_advanced():
     data = request.get_json()
     ticker = data.get("ticker", "VAS.AX")
     days_ahead = data.get("days_ahead", 30)
+    uncertainty = data.get("uncertainty", "ensemble")
+    if uncertainty not in UNCERTAINTY_MODES:
+        return jsonify({'error': f"Unknown uncertainty mode '{uncertainty}'. "
+                                 f"Available modes: {', '.join(UNCERTAINTY_MODES)}"}), 400
+    try:
+        mc_samples = clamp_mc_samples(data.get("mc_samples", DEFAULT_MC_SAMPLES))
+    except (TypeError, ValueError):
+        return jsonify({'error': f"mc_samples must be an integer, got {data.get('mc_samples')!r}"}), 400
+    engine = 'lstm_mc' if uncertainty == 'mc_dropout' else 'lstm'
+    # Precomputed MC dropout forecasts use the default sample count
+    use_cache = engine == 'lstm' or mc_samples == DEFAULT_MC_SAMPLES
     
     try:
-        market_data = EnhancedQuantStrategy(ticker=ticker).calculate_recommendation()
-        prediction = predict_future_advanced_parallel(ticker, days_ahead)
+        market_data = get_market_data(ticker)
+        prediction = ((use_cache and precompute_store.lookup_forecast(ticker, engine, days_ahead))
+                      or predict_future_advanced_parallel(ticker, days_ahead, uncertainty=uncertainty,
+                                                          mc_samples=mc_samples))
         
         # Generate summary
         summary = AnalysisSummary.generate_combined_summary(
@@ -65,10 +113,10 @@ def predict_advanced():
             ai_prediction=prediction['forecast']
         )
         
-        return jsonify({
+        return jsonify(snapshots.respond(request.path, data, {
             'forecast': prediction['forecast'],
             'summary': summary
-        })
+        }))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -80,11 +128,12 @@ def backtest():
     test_days = data.get("test_days", 30)
 
     try:
-        market_data = EnhancedQuantStrategy(ticker=ticker).calculate_recommendation()
+        market_data = get_market_data(ticker)
         backtest_results = backtest_model(ticker, train_period, test_days)
         
         # Use only the advanced model prediction
-        prediction = predict_future_advanced_parallel(ticker, days_ahead=test_days)
+        prediction = (precompute_store.lookup_forecast(ticker, 'lstm', test_days)
+                      or predict_future_advanced_parallel(ticker, days_ahead=test_days))
         
         # Generate summary with advanced model predictions
         summary = AnalysisSummary.generate_combined_summary(
@@ -93,13 +142,26 @@ def backtest():
             backtest_data=backtest_results
         )
         
-        return jsonify({
+        response = {
             'metrics': backtest_results['metrics'],
             'comparison_df': backtest_results['comparison_df'],
             'summary': summary
-        })
+        }
+        if data.get("compare_engines"):
+            response['engine_comparison'] = compare_engines(
+                ticker, train_period, test_days, engines=data.get("engines")
+            )
+        
+        return jsonify(snapshots.respond(request.path, data, response))
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/resources', methods=['GET'])
+def resource_usage():
+    return jsonify(resources.report())
+
 if __name__ == '__main__':
+    # The debug reloader runs this block in two processes; only the serving child schedules
+    if precompute_config['scheduler_enabled'] and os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        PrecomputeScheduler(precompute_config, precompute_store).start()
     app.run(debug=True, port=5000)
\ No newline at end of file
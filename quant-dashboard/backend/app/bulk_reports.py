@@ -0,0 +1,90 @@
+# bulk_reports.py
+
+import os
+import re
+import json
+import time
+import argparse
+from multiprocessing import Pool
+from main_strategy import EnhancedQuantStrategy
+from report_generator import ReportGenerator
+from resource_manager import resources, limit_blas_threads
+from precompute_config import load_config
+
+def generate_ticker_report(ticker: str, monthly_target: float, total_target: float, output_dir: str) -> dict:
+    """Fetch data, build the analysis report for one ticker and write it to output_dir."""
+    start = time.perf_counter()
+    try:
+        strategy = EnhancedQuantStrategy(ticker=ticker, monthly_target=monthly_target, total_target=total_target)
+        data, moving_averages = strategy.get_historical_data()
+        results = strategy.recommendation_from_data(data, moving_averages)
+        report_results = ReportGenerator.prepare_report_results(results, data)
+        report = ReportGenerator.generate_analysis_report(report_results, ticker, monthly_target)
+
+        path = os.path.join(output_dir, re.sub(r'[^A-Za-z0-9._-]', '_', ticker) + '.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(report)
+
+        error = report if report.startswith('Error generating report') else None
+        return {'ticker': ticker, 'path': path, 'seconds': time.perf_counter() - start, 'error': error}
+    except Exception as e:
+        return {'ticker': ticker, 'path': None, 'seconds': time.perf_counter() - start, 'error': str(e)}
+
+def generate_reports(tickers, output_dir: str, monthly_target: float = 2000, total_target: float = 10000,
+                     workers: int = None) -> list:
+    """
+    Generate analysis reports for many tickers across a process pool.
+
+    Each report is written as soon as its ticker finishes, and an index.json
+    with per-ticker timings and errors is written at the end.
+
+    Returns:
+    - list: One {'ticker', 'path', 'seconds', 'error'} dict per ticker, in completion order
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    tickers = list(dict.fromkeys(tickers))
+    workers = workers or min(resources.total_cores, len(tickers)) or 1
+
+    started = time.perf_counter()
+    results = []
+    # One single-threaded worker per core instead of every worker spawning BLAS threads
+    with Pool(workers, initializer=limit_blas_threads, initargs=(1,)) as pool:
+        jobs = [(ticker, monthly_target, total_target, output_dir) for ticker in tickers]
+        for result in pool.imap_unordered(_generate_ticker_report, jobs):
+            results.append(result)
+            status = f"error: {result['error']}" if result['error'] else result['path']
+            print(f"[{len(results)}/{len(tickers)}] {result['ticker']} ({result['seconds']:.1f}s) -> {status}")
+
+    with open(os.path.join(output_dir, 'index.json'), 'w') as f:
+        json.dump({
+            'duration_seconds': time.perf_counter() - started,
+            'workers': workers,
+            'reports': results
+        }, f, indent=2)
+    return results
+
+def _generate_ticker_report(job):
+    return generate_ticker_report(*job)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate analysis reports for a list of tickers in parallel.")
+    parser.add_argument('tickers', nargs='*', help="Tickers to report on (default: precompute.yaml watchlist)")
+    parser.add_argument('--tickers-file', help="File with one ticker per line")
+    parser.add_argument('--output-dir', default='reports', help="Directory to write reports to")
+    parser.add_argument('--workers', type=int, help="Number of worker processes (default: available cores)")
+    parser.add_argument('--monthly-target', type=float, default=2000)
+    parser.add_argument('--total-target', type=float, default=10000)
+    args = parser.parse_args()
+
+    tickers = list(args.tickers)
+    if args.tickers_file:
+        with open(args.tickers_file) as f:
+            tickers += [line.strip() for line in f if line.strip() and not line.startswith('#')]
+    if not tickers:
+        tickers = load_config()['tickers']
+
+    results = generate_reports(tickers, args.output_dir, args.monthly_target, args.total_target, args.workers)
+    failed = [result['ticker'] for result in results if result['error']]
+    print(f"\nGenerated {len(results) - len(failed)}/{len(results)} reports in {args.output_dir}")
+    if failed:
+        print(f"Failed: {', '.join(failed)}")
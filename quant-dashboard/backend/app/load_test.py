@@ -0,0 +1,333 @@
+# load_test.py
+
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+import subprocess
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import numpy as np
+from synthetic_market import DEFAULT_AS_OF
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_MIX = 'analyze=60,predict=30,predict-advanced=5,backtest=5'
+DEFAULT_TICKERS = 'VAS.AX,IVV.AX,NDQ.AX,VDHG.AX,ZIP.AX'
+
+ENDPOINT_PAYLOADS = {
+    'analyze': lambda ticker: {'ticker': ticker, 'monthly_target': 2000, 'total_target': 10000},
+    'predict': lambda ticker: {'ticker': ticker},
+    'predict-advanced': lambda ticker: {'ticker': ticker, 'days_ahead': 30},
+    'backtest': lambda ticker: {'ticker': ticker, 'train_period': '5y', 'test_days': 30}
+}
+
+def parse_mix(mix: str) -> dict:
+    """Parse 'analyze=60,predict=30' into normalised endpoint weights."""
+    weights = {}
+    for part in mix.split(','):
+        name, weight = part.split('=')
+        if name not in ENDPOINT_PAYLOADS:
+            raise ValueError(f"Unknown endpoint '{name}'. Available endpoints: {', '.join(ENDPOINT_PAYLOADS)}")
+        weights[name] = float(weight)
+    total = sum(weights.values())
+    return {name: weight / total for name, weight in weights.items() if weight > 0}
+
+def _proc_rss_kb(pid: int):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+def _proc_descendants(pid: int) -> list:
+    """Pids of every descendant of a process, read from /proc."""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so split after its closing parenthesis
+                parents[int(entry)] = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    descendants, frontier = [], [pid]
+    while frontier:
+        children = [child for child, parent in parents.items() if parent in frontier]
+        descendants += children
+        frontier = children
+    return descendants
+
+def read_rss_mb(pid: int):
+    """
+    Resident memory of a process and all of its children in MB, or None if it
+    cannot be read on this platform.
+
+    The server forks worker pools for LSTM training and precompute, so the parent's
+    RSS alone misses most of the memory under load.
+    """
+    if psutil is not None:
+        try:
+            process = psutil.Process(pid)
+            total = process.memory_info().rss
+            children = process.children(recursive=True)
+        except psutil.Error:
+            return None
+        for child in children:
+            try:
+                total += child.memory_info().rss
+            except psutil.Error:
+                pass  # Child exited between listing and reading
+        return total / 1024 ** 2
+
+    total = _proc_rss_kb(pid)
+    if total is None:
+        return None
+    for child in _proc_descendants(pid):
+        total += _proc_rss_kb(child) or 0
+    return total / 1024
+
+def serve(port: int, as_of: str) -> None:
+    """Run the Flask app against synthetic market data (used as the load test target)."""
+    from synthetic_market import install_synthetic_market_data
+    install_synthetic_market_data(as_of)
+
+    import app as app_module
+    from precompute import PrecomputeStore
+
+    # Point the precompute store at an empty directory so every request does the live work
+    app_module.precompute_store = PrecomputeStore({**app_module.precompute_config, 'store_dir': tempfile.mkdtemp()})
+    app_module.app.run(port=port, threaded=True, debug=False, use_reloader=False)
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def _wait_for_server(base_url: str, process: subprocess.Popen, timeout: float = 120) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited during startup with code {process.returncode}")
+        try:
+            urllib.request.urlopen(base_url, timeout=1)
+            return
+        except urllib.error.HTTPError:
+            return  # Any HTTP response means the server is accepting requests
+        except (urllib.error.URLError, OSError):
+            time.sleep(0.5)
+    raise RuntimeError(f"App did not start within {timeout:.0f}s")
+
+def _send_request(base_url: str, endpoint: str, payload: dict, timeout: float, scheduled: float) -> dict:
+    """
+    Send one request and time it from its scheduled start.
+
+    Measuring from `scheduled` rather than from when a worker picks the request up
+    keeps time spent queued behind slow requests in the latency (no coordinated omission).
+    """
+    request = urllib.request.Request(
+        f"{base_url}/api/{endpoint}",
+        data=json.dumps(payload).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    sent = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            body = response.read()
+            status = response.status
+        error = json.loads(body).get('error') if body.startswith(b'{') else None
+    except urllib.error.HTTPError as e:
+        status, error = e.code, e.read().decode(errors='replace')[:200]
+    except Exception as e:
+        status, error = None, str(e)
+    return {
+        'endpoint': endpoint,
+        'status': status,
+        'error': error,
+        'latency': time.perf_counter() - scheduled,
+        'queue_seconds': sent - scheduled
+    }
+
+def summarise(samples: list, elapsed: float) -> dict:
+    """Throughput, latency percentiles and error rate for a list of request samples."""
+    if not samples:
+        return {'requests': 0}
+    latencies = np.array([sample['latency'] for sample in samples]) * 1000
+    errors = sum(1 for sample in samples if sample['error'] or sample['status'] != 200)
+    return {
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': errors / len(samples),
+        'throughput_rps': len(samples) / elapsed if elapsed > 0 else 0,
+        'mean_queue_ms': float(np.mean([sample['queue_seconds'] for sample in samples]) * 1000),
+        'latency_ms': {
+            'mean': float(latencies.mean()),
+            'p50': float(np.percentile(latencies, 50)),
+            'p95': float(np.percentile(latencies, 95)),
+            'p99': float(np.percentile(latencies, 99)),
+            'max': float(latencies.max())
+        }
+    }
+
+def run_load_test(base_url: str, mix: dict, tickers: list, rate: float, concurrency: int,
+                  duration: float, timeout: float = 600, seed: int = 0, server_pid: int = None,
+                  memory_interval: float = 1.0) -> dict:
+    """
+    Replay a weighted endpoint mix at a fixed arrival rate and collect results.
+
+    Requests are scheduled open-loop at `rate` per second; at most `concurrency`
+    are in flight and the rest wait in the executor queue. Latency is measured
+    from each request's scheduled time, so queueing counts towards it.
+
+    Returns:
+    - dict: Overall and per-endpoint summaries plus memory samples of the server process
+    """
+    rng = random.Random(seed)
+    endpoints, weights = zip(*mix.items())
+    samples, memory = [], []
+    samples_lock = threading.Lock()
+    stop_sampling = threading.Event()
+    started = time.perf_counter()
+
+    def sample_memory():
+        while True:
+            if server_pid is not None:
+                memory.append({'t': time.perf_counter() - started, 'rss_mb': read_rss_mb(server_pid)})
+            if stop_sampling.wait(memory_interval):
+                break
+
+    def record(future):
+        with samples_lock:
+            samples.append(future.result())
+
+    sampler = threading.Thread(target=sample_memory, daemon=True)
+    sampler.start()
+
+    n_requests = int(rate * duration)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for i in range(n_requests):
+            scheduled = started + i / rate
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            endpoint = rng.choices(endpoints, weights)[0]
+            payload = ENDPOINT_PAYLOADS[endpoint](rng.choice(tickers))
+            executor.submit(_send_request, base_url, endpoint, payload, timeout, scheduled).add_done_callback(record)
+
+    elapsed = time.perf_counter() - started
+    stop_sampling.set()
+    sampler.join()
+
+    return {
+        'overall': summarise(samples, elapsed),
+        'endpoints': {
+            endpoint: summarise([s for s in samples if s['endpoint'] == endpoint], elapsed)
+            for endpoint in endpoints
+        },
+        'elapsed_seconds': elapsed,
+        'memory': memory
+    }
+
+def _git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=APP_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the dashboard API against synthetic market data.")
+    parser.add_argument('--rate', type=float, default=2.0, help="Target requests per second")
+    parser.add_argument('--concurrency', type=int, default=8, help="Maximum requests in flight")
+    parser.add_argument('--duration', type=float, default=60, help="Seconds to generate load for")
+    parser.add_argument('--mix', default=DEFAULT_MIX, help="Weighted endpoint mix, e.g. analyze=60,predict=40")
+    parser.add_argument('--tickers', default=DEFAULT_TICKERS, help="Comma separated tickers to request")
+    parser.add_argument('--timeout', type=float, default=600, help="Per-request timeout in seconds")
+    parser.add_argument('--seed', type=int, default=0, help="Seed for the request sequence")
+    parser.add_argument('--url', help="Target an already running app instead of starting one")
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF, help="Last date of the synthetic price data (default: %(default)s)")
+    parser.add_argument('--label', help="Release label stored with the results")
+    parser.add_argument('--output', help="JSON results file (default: load_test_<timestamp>.json)")
+    parser.add_argument('--serve', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.port, args.as_of)
+        return
+
+    mix = parse_mix(args.mix)
+    tickers = [ticker.strip() for ticker in args.tickers.split(',') if ticker.strip()]
+
+    process = None
+    base_url = args.url
+    if base_url is None:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        process = subprocess.Popen([sys.executable, os.path.abspath(__file__), '--serve', '--port', str(port),
+                                    '--as-of', args.as_of], cwd=APP_DIR)
+
+    try:
+        if process is not None:
+            _wait_for_server(base_url, process)
+        print(f"Load testing {base_url} at {args.rate} req/s, concurrency {args.concurrency}, {args.duration}s")
+        results = run_load_test(
+            base_url, mix, tickers, args.rate, args.concurrency, args.duration,
+            timeout=args.timeout, seed=args.seed, server_pid=process.pid if process else None
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    report = {
+        'label': args.label,
+        'git_revision': _git_revision(),
+        'timestamp': datetime.now().isoformat(),
+        'config': {
+            'rate': args.rate,
+            'concurrency': args.concurrency,
+            'duration': args.duration,
+            'mix': mix,
+            'tickers': tickers,
+            'seed': args.seed,
+            'synthetic_data': args.url is None,
+            'as_of': args.as_of if args.url is None else None
+        },
+        **results
+    }
+
+    output = args.output or f"load_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    overall = results['overall']
+    print(f"\n{'endpoint':<18}{'requests':>9}{'errors':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, stats in [('overall', overall)] + list(results['endpoints'].items()):
+        if not stats['requests']:
+            continue
+        latency = stats['latency_ms']
+        print(f"{name:<18}{stats['requests']:>9}{stats['errors']:>8}"
+              f"{latency['p50']:>10.1f}{latency['p95']:>10.1f}{latency['p99']:>10.1f}")
+    if overall['requests']:
+        print(f"\nThroughput: {overall['throughput_rps']:.2f} req/s, error rate {overall['error_rate']:.1%}")
+    print(f"Results saved to {output}")
+
+if __name__ == "__main__":
+    main()
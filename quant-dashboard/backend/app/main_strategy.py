@@ -106,7 +106,13 @@ class EnhancedQuantStrategy:
         try:
             # Get historical data and calculate indicators
             data, moving_averages = self.get_historical_data()
-            
+        except Exception as e:
+            raise Exception(f"Error in calculation: {str(e)}")
+        return self.recommendation_from_data(data, moving_averages)
+    
+    def recommendation_from_data(self, data, moving_averages):
+        """Generate the recommendation from an indicator frame returned by get_historical_data."""
+        try:
             # Extract current metrics
             current_price = data['Close'].iloc[-1]
             rsi = data['RSI'].iloc[-1] if 'RSI' in data else 50
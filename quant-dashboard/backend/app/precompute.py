@@ -0,0 +1,313 @@
+# precompute.py
+
+import os
+import re
+import json
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pandas as pd
+from main_strategy import EnhancedQuantStrategy
+from AI.forecast_engines import run_forecast
+from AI.predict_future_fast import FAST_METHODS, predict_future_fast_batch
+from precompute_config import CONFIG_PATH, load_config, market_of
+
+def _session_close(market: dict, day: pd.Timestamp) -> pd.Timestamp:
+    hour, minute = (int(part) for part in market['close_time'].split(':'))
+    return day.normalize() + pd.Timedelta(hours=hour, minutes=minute)
+
+def current_session(config: dict, market: str, now: pd.Timestamp = None) -> str:
+    """Date of the market's most recent trading session that has already closed."""
+    market = config['markets'][market]
+    now = (now or pd.Timestamp.now(tz='UTC')).tz_convert(market['timezone'])
+    day = now.normalize()
+    if now < _session_close(market, day):
+        day -= pd.Timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= pd.Timedelta(days=1)
+    return day.strftime('%Y-%m-%d')
+
+def next_run_time(config: dict, market: str, now: pd.Timestamp = None) -> pd.Timestamp:
+    """Next weekday close of the market plus the configured delay."""
+    delay = pd.Timedelta(minutes=config['delay_minutes'])
+    market = config['markets'][market]
+    now = (now or pd.Timestamp.now(tz='UTC')).tz_convert(market['timezone'])
+    day = now.normalize()
+    while True:
+        run_at = _session_close(market, day) + delay
+        if day.weekday() < 5 and run_at > now:
+            return run_at
+        day += pd.Timedelta(days=1)
+
+class PrecomputeStore:
+    """JSON file store of precomputed results, one file per ticker plus one report per run."""
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.ticker_dir = os.path.join(config['store_dir'], 'tickers')
+        self.report_dir = os.path.join(config['store_dir'], 'runs')
+        self._lock = threading.Lock()
+
+    def _ticker_path(self, ticker: str) -> str:
+        return os.path.join(self.ticker_dir, re.sub(r'[^A-Za-z0-9._-]', '_', ticker) + '.json')
+
+    @staticmethod
+    def _read(path: str):
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path: str, payload: dict) -> None:
+        # Write to a temp file first so readers never see a half-written entry
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(payload, f)
+        with self._lock:
+            os.replace(tmp_path, path)
+
+    def load(self, ticker: str):
+        return self._read(self._ticker_path(ticker))
+
+    def save(self, ticker: str, entry: dict) -> None:
+        self._write(self._ticker_path(ticker), entry)
+
+    def load_session_entry(self, ticker: str, market: str, session: str) -> dict:
+        """Stored entry for the session, or a fresh empty one."""
+        entry = self.load(ticker)
+        if not entry or entry.get('market') != market or entry.get('session') != session:
+            entry = {'ticker': ticker, 'market': market, 'session': session, 'analysis': None, 'forecasts': {}}
+        return entry
+
+    def _fresh_entry(self, ticker: str):
+        """Stored entry if it belongs to the latest closed session of the ticker's own market."""
+        entry = self.load(ticker)
+        if not entry:
+            return None
+        market = market_of(self.config, ticker)
+        if market is None or entry.get('market') != market:
+            return None
+        if entry.get('session') != current_session(self.config, market):
+            return None
+        return entry
+
+    def lookup_analysis(self, ticker: str):
+        """calculate_recommendation output for the latest closed session, if precomputed."""
+        entry = self._fresh_entry(ticker)
+        return entry.get('analysis') if entry else None
+
+    def lookup_forecast(self, ticker: str, engine: str, days_ahead: int):
+        """Forecast for the latest closed session, if precomputed with the same horizon."""
+        entry = self._fresh_entry(ticker)
+        if not entry:
+            return None
+        forecast = entry['forecasts'].get(engine)
+        if forecast and forecast['days_ahead'] == days_ahead:
+            return {'forecast': forecast['forecast']}
+        return None
+
+    def save_report(self, report: dict) -> None:
+        self._write(os.path.join(self.report_dir, f"{report['market']}-{report['session']}.json"), report)
+
+    def load_report(self, market: str, session: str):
+        return self._read(os.path.join(self.report_dir, f"{market}-{session}.json"))
+
+def cached_recommendation(store: PrecomputeStore, ticker: str, monthly_target: float, total_target: float):
+    """Rebuild the /api/analyze payload from precomputed metrics for the requested targets."""
+    analysis = store.lookup_analysis(ticker)
+    if analysis is None:
+        return None
+
+    metrics = analysis['metrics']
+    strategy = EnhancedQuantStrategy(ticker=ticker, monthly_target=monthly_target, total_target=total_target)
+    investment_rec = strategy.calculate_investment_recommendation(
+        metrics['current_price'],
+        metrics['performance_metrics']['market_regime'],
+        metrics['performance_metrics']['volatility']
+    )
+    return {**analysis, 'investment_recommendation': investment_rec}
+
+def _run_with_retries(step, max_retries: int):
+    for attempt in range(max_retries + 1):
+        try:
+            return step(), None
+        except Exception as e:
+            error = str(e)
+    return None, error
+
+def _precompute_ticker(store: PrecomputeStore, ticker: str, market: str, session: str, config: dict) -> dict:
+    """Compute every missing result for one ticker, saving after each step so a failed run can resume."""
+    entry = store.load_session_entry(ticker, market, session)
+    days_ahead = config['days_ahead']
+
+    steps = []
+    if entry['analysis'] is None:
+        steps.append(('analysis', lambda: EnhancedQuantStrategy(ticker=ticker).calculate_recommendation()))
+    for engine in config['engines']:
+        if engine not in FAST_METHODS and engine not in entry['forecasts']:
+            steps.append((engine, lambda engine=engine: run_forecast(engine, ticker, days_ahead)))
+
+    timings, errors = {}, {}
+    for name, step in steps:
+        start = time.perf_counter()
+        result, error = _run_with_retries(step, config['max_retries'])
+        timings[name] = time.perf_counter() - start
+
+        if error is not None:
+            errors[name] = error
+            continue
+        if name == 'analysis':
+            entry['analysis'] = result
+        else:
+            entry['forecasts'][name] = {'days_ahead': days_ahead, 'forecast': result['forecast']}
+        entry['computed_at'] = pd.Timestamp.now(tz='UTC').isoformat()
+        store.save(ticker, entry)
+
+    status = 'failed' if errors else 'ok' if steps else 'cached'
+    return {'status': status, 'timings': timings, 'errors': errors}
+
+def _precompute_fast_forecasts(store: PrecomputeStore, tickers: list, market: str, session: str, config: dict,
+                               report: dict) -> None:
+    """Fit the statistical engines for all pending tickers in one vectorized batch per engine."""
+    for engine in config['engines']:
+        if engine not in FAST_METHODS:
+            continue
+        pending = [ticker for ticker in tickers
+                   if engine not in store.load_session_entry(ticker, market, session)['forecasts']]
+        if not pending:
+            continue
+
+        start = time.perf_counter()
+        try:
+            results = predict_future_fast_batch(pending, config['days_ahead'], method=engine)
+        except Exception as e:
+            results = {ticker: {'error': str(e)} for ticker in pending}
+        report['batch_timings'][engine] = time.perf_counter() - start
+
+        for ticker in pending:
+            result = results.get(ticker, {'error': f"No data returned for {ticker}"})
+            if 'error' in result:
+                report['tickers'][ticker]['errors'][engine] = result['error']
+                continue
+            entry = store.load_session_entry(ticker, market, session)
+            entry['forecasts'][engine] = {'days_ahead': config['days_ahead'], 'forecast': result['forecast']}
+            entry['computed_at'] = pd.Timestamp.now(tz='UTC').isoformat()
+            store.save(ticker, entry)
+
+def run_precompute(market: str, config: dict = None, store: PrecomputeStore = None, session: str = None) -> dict:
+    """
+    Refresh analysis and forecasts for every ticker of one market and store them.
+
+    Results already stored for the session are skipped, so re-running after a
+    failure only recomputes what is missing.
+
+    Returns:
+    - dict: Run report with per-ticker status, step timings and errors
+    """
+    config = config or load_config()
+    store = store or PrecomputeStore(config)
+    session = session or current_session(config, market)
+    tickers = list(dict.fromkeys(config['markets'][market]['tickers']))
+
+    started = time.perf_counter()
+    report = {
+        'market': market,
+        'session': session,
+        'started_at': pd.Timestamp.now(tz='UTC').isoformat(),
+        'max_workers': config['max_workers'],
+        'engines': config['engines'],
+        'batch_timings': {},
+        'tickers': {ticker: {'status': 'pending', 'timings': {}, 'errors': {}} for ticker in tickers}
+    }
+
+    _precompute_fast_forecasts(store, tickers, market, session, config, report)
+
+    with ThreadPoolExecutor(max_workers=config['max_workers']) as executor:
+        futures = {
+            executor.submit(_precompute_ticker, store, ticker, market, session, config): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            ticker_report = report['tickers'][ticker]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {'status': 'failed', 'timings': {}, 'errors': {'pipeline': str(e)}}
+            ticker_report['timings'].update(result['timings'])
+            ticker_report['errors'].update(result['errors'])
+            ticker_report['status'] = 'failed' if ticker_report['errors'] else result['status']
+            print(f"[precompute] {ticker}: {ticker_report['status']} "
+                  f"({sum(ticker_report['timings'].values()):.1f}s)")
+
+    report['finished_at'] = pd.Timestamp.now(tz='UTC').isoformat()
+    report['duration_seconds'] = time.perf_counter() - started
+    report['failed'] = [ticker for ticker, result in report['tickers'].items() if result['status'] == 'failed']
+    store.save_report(report)
+    return report
+
+class PrecomputeScheduler(threading.Thread):
+    """Background thread that runs the precompute pipeline after every market's session close."""
+
+    def __init__(self, config: dict = None, store: PrecomputeStore = None):
+        super().__init__(daemon=True, name='precompute-scheduler')
+        self.config = config or load_config()
+        self.store = store or PrecomputeStore(self.config)
+        self._stop_event = threading.Event()
+
+    def _session_complete(self, market: str) -> bool:
+        report = self.store.load_report(market, current_session(self.config, market))
+        return report is not None and not report['failed']
+
+    def run(self):
+        # Catch up on missed or failed runs before waiting for the next close
+        for market in self.config['markets']:
+            if not self._session_complete(market):
+                self._run_once(market)
+
+        while not self._stop_event.is_set():
+            now = pd.Timestamp.now(tz='UTC')
+            market, run_at = min(
+                ((market, next_run_time(self.config, market, now)) for market in self.config['markets']),
+                key=lambda item: item[1]
+            )
+            if self._stop_event.wait((run_at - now).total_seconds()):
+                break
+            self._run_once(market)
+
+    def _run_once(self, market: str):
+        try:
+            report = run_precompute(market, self.config, self.store)
+            print(f"[precompute] {market} session {report['session']} finished in "
+                  f"{report['duration_seconds']:.1f}s, {len(report['failed'])} failed")
+        except Exception as e:
+            print(f"[precompute] {market} run failed: {str(e)}")
+
+    def stop(self):
+        self._stop_event.set()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute analysis and forecasts for the watchlist.")
+    parser.add_argument('--config', default=CONFIG_PATH, help="Path to the precompute YAML config")
+    parser.add_argument('--schedule', action='store_true', help="Keep running after every session close")
+    parser.add_argument('--max-workers', type=int, help="Override the configured concurrency budget")
+    parser.add_argument('--market', action='append', help="Only run these markets (default: all)")
+    args = parser.parse_args()
+
+    config = load_config(args.config)
+    if args.max_workers:
+        config['max_workers'] = args.max_workers
+
+    if args.schedule:
+        scheduler = PrecomputeScheduler(config)
+        scheduler.start()
+        scheduler.join()
+    else:
+        for market in args.market or config['markets']:
+            report = run_precompute(market, config)
+            print(json.dumps(report, indent=2))
@@ -0,0 +1,43 @@
+# precompute_config.py
+
+import os
+import yaml
+
+# No analysis or forecasting imports, so reading the watchlist stays cheap
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+CONFIG_PATH = os.path.join(APP_DIR, 'precompute.yaml')
+
+DEFAULT_CONFIG = {
+    'markets': {
+        'ASX': {'timezone': 'Australia/Sydney', 'close_time': '16:00', 'tickers': ['VAS.AX']}
+    },
+    'delay_minutes': 20,
+    'max_workers': 2,
+    'max_retries': 1,
+    'engines': ['prophet', 'lstm', 'ets'],
+    'days_ahead': 30,
+    'store_dir': os.path.join(APP_DIR, 'precomputed'),
+    'scheduler_enabled': False
+}
+
+def load_config(path: str = CONFIG_PATH) -> dict:
+    """Load the precompute configuration, falling back to defaults for missing keys."""
+    config = dict(DEFAULT_CONFIG)
+    if os.path.exists(path):
+        with open(path) as f:
+            config.update(yaml.safe_load(f) or {})
+    if os.environ.get('PRECOMPUTE_SCHEDULER') == '1':
+        config['scheduler_enabled'] = True
+    config['store_dir'] = os.path.join(APP_DIR, config['store_dir'])
+    config['tickers'] = list(dict.fromkeys(
+        ticker for market in config['markets'].values() for ticker in market['tickers']
+    ))
+    return config
+
+def market_of(config: dict, ticker: str):
+    """Name of the configured market that lists the ticker, or None."""
+    for name, market in config['markets'].items():
+        if ticker in market['tickers']:
+            return name
+    return None
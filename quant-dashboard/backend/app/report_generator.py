@@ -1,6 +1,40 @@
 # command line only. 
 
+from technical_indicators import TechnicalIndicators
+
 class ReportGenerator:
+    @staticmethod
+    def prepare_report_results(results: dict, data) -> dict:
+        """Add the report-only metrics missing from calculate_recommendation output."""
+        extra = TechnicalIndicators.calculate_report_metrics(data)
+        metrics = results['metrics']
+        recommendation = results['investment_recommendation']
+
+        return {
+            **results,
+            'metrics': {
+                **metrics,
+                'technical_metrics': {
+                    **metrics['technical_metrics'],
+                    'macd_hist': extra['macd_hist'],
+                    'stoch_k': extra['stoch_k'],
+                    'stoch_d': extra['stoch_d']
+                },
+                'performance_metrics': {
+                    **metrics['performance_metrics'],
+                    'sortino_ratio': extra['sortino_ratio'],
+                    'max_drawdown': extra['max_drawdown'],
+                    'annualized_return': extra['annualized_return'],
+                    'annualized_volatility': extra['annualized_volatility']
+                },
+                'volume_profile': {'poc': extra['poc'], 'vwap': extra['vwap']},
+                'market_regime': metrics['performance_metrics']['market_regime'],
+                'volatility': extra['volatility']
+            },
+            'position_multiplier': recommendation['allocation_multiplier'],
+            'recommended_investment': recommendation['recommended_amount']
+        }
+
     @staticmethod
     def generate_analysis_report(results: dict, ticker: str, monthly_target: float) -> str:
         """Generate comprehensive analysis report with formatted output."""
@@ -48,7 +82,7 @@ KEY METRICS SUMMARY
    ✦ Sortino Ratio: {metrics['performance_metrics']['sortino_ratio']:.2f}
      → {' Excellent' if metrics['performance_metrics']['sortino_ratio'] > 2 else 'Good' if metrics['performance_metrics']['sortino_ratio'] > 1 else 'Poor'} downside risk management
    ✦ Max Drawdown: {metrics['performance_metrics']['max_drawdown']:.2%}
-     → {'Low' if abs(metrics['performance_metrics']['max_drawdown']) < 10 else 'Moderate' if abs(metrics['performance_metrics']['max_drawdown']) < 20 else 'High'} historical risk
+     → {'Low' if abs(metrics['performance_metrics']['max_drawdown']) < 0.10 else 'Moderate' if abs(metrics['performance_metrics']['max_drawdown']) < 0.20 else 'High'} historical risk
 
 2. Technical Signals
    ✦ RSI ({rsi:.1f}): {rsi_signal}
@@ -65,7 +99,7 @@ KEY METRICS SUMMARY
 4. Momentum & Volume
    ✦ Price Momentum (20D): {metrics['momentum']['price_momentum']:.2%}
    ✦ Volume Momentum (20D): {metrics['momentum']['volume_momentum']:.2%}
-     → {'Strong' if abs(metrics['momentum']['volume_momentum']) > 50 else 'Moderate' if abs(metrics['momentum']['volume_momentum']) > 20 else 'Weak'} volume activity
+     → {'Strong' if abs(metrics['momentum']['volume_momentum']) > 0.5 else 'Moderate' if abs(metrics['momentum']['volume_momentum']) > 0.2 else 'Weak'} volume activity
 
 5. Risk Assessment
    ✦ Market Regime: {metrics['market_regime']:.2f}
@@ -0,0 +1,159 @@
+# resource_manager.py
+
+import os
+import time
+import threading
+import multiprocessing
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Cores requested by each kind of heavy job (capped at the machine's core count)
+JOB_CORES = {
+    'prophet': 1,
+    'lstm': 5,      # One core per ensemble model
+    'lstm_mc': 2
+}
+
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'VECLIB_MAXIMUM_THREADS',
+    'NUMEXPR_NUM_THREADS'
+)
+
+# TensorFlow workers are spawned, not forked: a forked child inherits the parent's
+# already initialised TensorFlow runtime, whose thread pools can no longer be resized
+worker_context = multiprocessing.get_context('spawn')
+
+_thread_limits = None
+_thread_config_error = None
+
+def limit_blas_threads(threads: int) -> None:
+    """Limit the BLAS/OpenMP thread pools of the current process."""
+    global _thread_limits
+    threads = max(1, int(threads))
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    if threadpool_limits is not None:
+        _thread_limits = threadpool_limits(limits=threads)
+
+def configure_process_threads(threads: int) -> None:
+    """
+    Limit BLAS/OpenMP and TensorFlow thread pools of the current process.
+
+    Used as the initializer of worker_context pools, before TensorFlow has run
+    anything in the worker. A failure is recorded instead of raised, because a
+    raising initializer makes the pool respawn workers forever; tasks call
+    check_process_threads to report it.
+    """
+    global _thread_config_error
+    threads = max(1, int(threads))
+    limit_blas_threads(threads)
+
+    try:
+        import tensorflow as tf
+        tf.config.threading.set_intra_op_parallelism_threads(threads)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+    except (ImportError, RuntimeError) as e:
+        _thread_config_error = e
+
+def check_process_threads() -> None:
+    """Raise if configure_process_threads failed in this worker."""
+    if _thread_config_error is not None:
+        raise RuntimeError(f"Could not apply the TensorFlow thread budget: {str(_thread_config_error)}")
+
+def process_cpu_seconds() -> float:
+    """User plus system CPU time of the current process, without its children."""
+    times = os.times()
+    return times.user + times.system
+
+def children_cpu_seconds() -> float:
+    """User plus system CPU time of finished child processes (e.g. Prophet's Stan fit)."""
+    times = os.times()
+    return times.children_user + times.children_system
+
+class JobBudget:
+    def __init__(self, name: str, cores: int):
+        self.name = name
+        self.cores = cores
+        self.worker_cpu_seconds = 0.0
+
+    def add_cpu(self, seconds: float) -> None:
+        """Add CPU time a worker process spent on this job."""
+        self.worker_cpu_seconds += seconds
+
+class ResourceManager:
+    """
+    Hands out CPU core budgets to heavy jobs and queues jobs that don't fit.
+
+    Jobs are granted in arrival order. A job's CPU time is the CPU time of the
+    thread that runs it plus what its worker processes report via add_cpu, so
+    concurrent jobs don't count each other's work.
+    """
+
+    def __init__(self, total_cores: int = None, history: int = 200):
+        self.total_cores = total_cores or os.cpu_count() or 1
+        self._available = self.total_cores
+        self._condition = threading.Condition()
+        self._queue = deque()
+        self._running = {}
+        self._history = deque(maxlen=history)
+
+    def cores_for(self, name: str) -> int:
+        return min(JOB_CORES.get(name, 1), self.total_cores)
+
+    @contextmanager
+    def job(self, name: str, cores: int = None):
+        """Block until `cores` are free, then yield a JobBudget and release the cores on exit."""
+        cores = min(cores or self.cores_for(name), self.total_cores)
+        ticket = object()
+        queued_at = time.perf_counter()
+
+        with self._condition:
+            self._queue.append(ticket)
+            while self._queue[0] is not ticket or self._available < cores:
+                self._condition.wait()
+            self._queue.popleft()
+            self._available -= cores
+            self._running[ticket] = name
+            self._condition.notify_all()
+
+        started = time.perf_counter()
+        cpu_start = time.thread_time()
+        budget = JobBudget(name, cores)
+        try:
+            yield budget
+        finally:
+            wall_seconds = time.perf_counter() - started
+            cpu_seconds = time.thread_time() - cpu_start + budget.worker_cpu_seconds
+            with self._condition:
+                self._available += cores
+                del self._running[ticket]
+                self._history.append({
+                    'name': name,
+                    'cores': cores,
+                    'wait_seconds': started - queued_at,
+                    'wall_seconds': wall_seconds,
+                    'cpu_seconds': cpu_seconds,
+                    'cpu_utilization': cpu_seconds / (wall_seconds * cores) if wall_seconds > 0 else 0
+                })
+                self._condition.notify_all()
+
+    def report(self) -> dict:
+        with self._condition:
+            return {
+                'total_cores': self.total_cores,
+                'cores_in_use': self.total_cores - self._available,
+                'running': list(self._running.values()),
+                'queued': len(self._queue),
+                'jobs': list(self._history)
+            }
+
+# Shared by every request thread in the process; VCA_CPU_CORES overrides the core count
+resources = ResourceManager(int(os.environ.get('VCA_CPU_CORES', 0)) or None)
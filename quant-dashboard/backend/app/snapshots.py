@@ -0,0 +1,121 @@
+# snapshots.py
+
+import json
+import math
+import hashlib
+import secrets
+import threading
+from itertools import count
+from collections import OrderedDict
+
+# Record lists that are diffed row by row, with the field that identifies a row
+SERIES_KEYS = {
+    'moving_averages_data': 'date',
+    'forecast': 'ds',
+    'comparison_df': 'date'
+}
+
+_MISSING = object()
+
+def _same(old, new) -> bool:
+    if isinstance(old, float) and isinstance(new, float) and math.isnan(old) and math.isnan(new):
+        return True
+    if isinstance(old, dict) and isinstance(new, dict):
+        return old.keys() == new.keys() and _diff_dict(old, new) == ({}, [])
+    return old == new
+
+def _diff_dict(old: dict, new: dict, path: tuple = ()):
+    """
+    Nested dict of the values in `new` that differ from `old`, plus the key paths
+    (lists of keys from the top level) that only exist in `old`.
+    """
+    changes, removed = {}, []
+    for key, value in new.items():
+        previous = old.get(key, _MISSING)
+        if isinstance(previous, dict) and isinstance(value, dict):
+            nested, nested_removed = _diff_dict(previous, value, path + (key,))
+            if nested:
+                changes[key] = nested
+            removed += nested_removed
+        elif previous is _MISSING or not _same(previous, value):
+            changes[key] = value
+    removed += [list(path + (key,)) for key in old if key not in new]
+    return changes, removed
+
+def _diff_series(old: list, new: list, key: str):
+    """New or changed rows plus every row key of `new` in order, so clients can drop rows that are gone."""
+    old_rows = {row[key]: row for row in old}
+    records = [row for row in new if row[key] not in old_rows or not _same(old_rows[row[key]], row)]
+    keys = [row[key] for row in new]
+    if not records and keys == [row[key] for row in old]:
+        return None
+    return {'key': key, 'keys': keys, 'records': records}
+
+def diff_payload(old: dict, new: dict) -> dict:
+    """Split the difference between two payloads into changed values, removed key paths and series updates."""
+    series = {}
+    changes, removed = _diff_dict(
+        {name: value for name, value in old.items() if name not in SERIES_KEYS or name not in new},
+        {name: value for name, value in new.items() if name not in SERIES_KEYS or name not in old}
+    )
+    for name in SERIES_KEYS.keys() & old.keys() & new.keys():
+        previous, value = old[name], new[name]
+        if isinstance(previous, list) and isinstance(value, list):
+            update = _diff_series(previous, value, SERIES_KEYS[name])
+            if update:
+                series[name] = update
+        elif not _same(previous, value):
+            changes[name] = value
+    return {'changes': changes, 'removed': removed, 'series': series}
+
+class SnapshotStore:
+    """
+    Keeps the last few payload versions per request so clients can poll for deltas.
+
+    A new version is only created when the payload content changes. Cursors are
+    '<epoch>-<version>' with a random epoch per store, so they are unique across
+    requests, restarts and worker processes; a cursor from another ticker, process
+    or restart falls back to a full response.
+    """
+
+    def __init__(self, max_requests: int = 500, versions_per_request: int = 5):
+        self.max_requests = max_requests
+        self.versions_per_request = versions_per_request
+        self._epoch = secrets.token_hex(4)
+        self._versions = count(1)
+        self._snapshots = OrderedDict()
+        self._lock = threading.Lock()
+
+    def respond(self, endpoint: str, params: dict, payload: dict) -> dict:
+        """
+        Record the payload and build the response for the client's cursor.
+
+        Returns:
+        - dict: Full payload with 'cursor' and delta=False when the cursor is missing or expired,
+          otherwise {'cursor', 'delta': True, 'changes', 'removed', 'series'}
+        """
+        epoch, _, cursor_version = str(params.get('cursor')).partition('-')
+        key = (endpoint, json.dumps({k: v for k, v in params.items() if k != 'cursor'}, sort_keys=True, default=str))
+        digest = hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+        with self._lock:
+            history = self._snapshots.setdefault(key, OrderedDict())
+            self._snapshots.move_to_end(key)
+            if len(self._snapshots) > self.max_requests:
+                self._snapshots.popitem(last=False)
+
+            latest = next(reversed(history.items()), None)
+            if latest and latest[1][0] == digest:
+                version = latest[0]
+            else:
+                version = next(self._versions)
+                history[version] = (digest, payload)
+                if len(history) > self.versions_per_request:
+                    history.popitem(last=False)
+
+            base = history.get(int(cursor_version)) if epoch == self._epoch and cursor_version.isdigit() else None
+
+        cursor = f"{self._epoch}-{version}"
+        if base is None:
+            return {**payload, 'cursor': cursor, 'delta': False}
+        return {'cursor': cursor, 'delta': True, **diff_payload(base[1], payload)}
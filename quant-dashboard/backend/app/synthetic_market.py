@@ -0,0 +1,95 @@
+# synthetic_market.py
+
+import zlib
+from datetime import datetime, timedelta
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import yfinance as yf
+
+ANCHOR_DATE = '2010-01-04'
+# Last day of synthetic data; "now" in the app is mapped to this date so results
+# don't depend on the day the load test runs
+DEFAULT_AS_OF = '2026-10-16'
+PERIOD_DAYS = {'d': 1, 'wk': 7, 'mo': 31, 'y': 366}
+# Each field draws from its own stream, so a value for a given date never depends on other fields
+FIELD_STREAMS = {'params': 0, 'returns': 1, 'open': 2, 'spread': 3, 'volume': 4}
+
+_as_of = pd.Timestamp(DEFAULT_AS_OF)
+
+def _rng(ticker: str, field: str) -> np.random.Generator:
+    return np.random.default_rng([zlib.crc32(ticker.encode()), FIELD_STREAMS[field]])
+
+@lru_cache(maxsize=256)
+def _price_history(ticker: str, end_date: str) -> pd.DataFrame:
+    """Deterministic geometric random walk OHLCV series seeded from the ticker symbol."""
+    dates = pd.bdate_range(ANCHOR_DATE, end_date, name='Date')
+
+    params = _rng(ticker, 'params')
+    start_price = params.uniform(5, 500)
+    drift = params.uniform(-0.0002, 0.0006)
+    volatility = params.uniform(0.008, 0.03)
+    returns = _rng(ticker, 'returns').normal(drift, volatility, len(dates))
+    close = start_price * np.exp(np.cumsum(returns))
+
+    open_ = close * np.exp(_rng(ticker, 'open').normal(0, volatility / 3, len(dates)))
+    spread = np.abs(_rng(ticker, 'spread').normal(0, volatility / 2, len(dates)))
+    high = np.maximum(open_, close) * (1 + spread)
+    low = np.minimum(open_, close) * (1 - spread)
+    volume = _rng(ticker, 'volume').lognormal(13, 0.5, len(dates)).round()
+
+    return pd.DataFrame({
+        'Open': open_,
+        'High': high,
+        'Low': low,
+        'Close': close,
+        'Adj Close': close,
+        'Volume': volume
+    }, index=dates)
+
+def _period_start(period: str, end: datetime) -> datetime:
+    if period == 'max':
+        return pd.Timestamp(ANCHOR_DATE).to_pydatetime()
+    for suffix, days in PERIOD_DAYS.items():
+        if period.endswith(suffix) and period[:-len(suffix)].isdigit():
+            return end - timedelta(days=int(period[:-len(suffix)]) * days)
+    raise ValueError(f"Unsupported period '{period}'")
+
+def _history(ticker: str, start=None, end=None, period: str = '1mo') -> pd.DataFrame:
+    # Requested dates are relative to today; shift them so today lands on the as-of date
+    shift = pd.Timestamp(datetime.now()).normalize() - _as_of
+    end = min((pd.Timestamp(end).tz_localize(None) - shift).normalize(), _as_of) if end is not None else _as_of
+    start = ((pd.Timestamp(start).tz_localize(None) - shift).normalize() if start is not None
+             else pd.Timestamp(_period_start(period, end)))
+    data = _price_history(ticker, _as_of.strftime('%Y-%m-%d'))
+    return data.loc[start:end].copy()
+
+class SyntheticTicker:
+    """Stand-in for yfinance.Ticker that serves deterministic synthetic prices."""
+
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+
+    def history(self, period: str = '1mo', start=None, end=None, **kwargs) -> pd.DataFrame:
+        data = _history(self.ticker, start, end, period).drop(columns=['Adj Close'])
+        data.index = data.index.tz_localize('UTC')
+        return data
+
+def synthetic_download(tickers, period: str = '1mo', start=None, end=None, group_by: str = 'column', **kwargs) -> pd.DataFrame:
+    """Stand-in for yfinance.download; a list of tickers returns (field, ticker) columns."""
+    if isinstance(tickers, str) and ' ' not in tickers:
+        return _history(tickers, start, end, period)
+
+    symbols = tickers.split() if isinstance(tickers, str) else list(tickers)
+    frames = {symbol: _history(symbol, start, end, period) for symbol in symbols}
+    data = pd.concat(frames, axis=1)
+    if group_by != 'ticker':
+        data = data.swaplevel(axis=1).sort_index(axis=1)
+    return data
+
+def install_synthetic_market_data(as_of: str = DEFAULT_AS_OF) -> None:
+    """Route every yfinance call in this process to the synthetic provider, with data up to `as_of`."""
+    global _as_of
+    _as_of = pd.Timestamp(as_of).normalize()
+    yf.Ticker = SyntheticTicker
+    yf.download = synthetic_download
@@ -75,3 +75,29 @@ class TechnicalIndicators:
         obv_trend = 1 if data['OBV'].iloc[-1] > data['OBV'].iloc[-5] else -1
         regime_signals.append(obv_trend)
         return np.mean(regime_signals)
+
+    @staticmethod
+    def calculate_report_metrics(data: pd.DataFrame, trading_days: int = 252, profile_bins: int = 50) -> dict:
+        close = data['Close']
+        returns = close.pct_change().dropna()
+        years = len(returns) / trading_days
+        downside = np.sqrt(np.mean(np.minimum(returns, 0) ** 2)) * np.sqrt(trading_days)
+        annualized_volatility = returns.std() * np.sqrt(trading_days)
+        drawdown = close / close.cummax() - 1
+
+        # Point of control: price bin with the most traded volume
+        volume_by_price, edges = np.histogram(close, bins=profile_bins, weights=data['Volume'])
+        poc_bin = np.argmax(volume_by_price)
+
+        return {
+            'annualized_return': (close.iloc[-1] / close.iloc[0]) ** (1 / years) - 1 if years > 0 else 0,
+            'annualized_volatility': annualized_volatility,
+            'sortino_ratio': returns.mean() * trading_days / downside if downside != 0 else 0,
+            'max_drawdown': drawdown.min(),
+            'volatility': data['Volatility'].iloc[-1],
+            'macd_hist': data['MACD_Histogram'].iloc[-1],
+            'stoch_k': data['Stoch_K'].iloc[-1],
+            'stoch_d': data['Stoch_D'].iloc[-1],
+            'poc': (edges[poc_bin] + edges[poc_bin + 1]) / 2,
+            'vwap': data['VWAP'].iloc[-1]
+        }
@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from "react";
+import React, { useEffect, useRef, useState } from "react";
 import {
   LineChart,
   Line,
@@ -10,27 +10,24 @@ import {
   Legend,
 } from "recharts";
 import MetricCard from "../MetricCard";
+import postWithDelta from "../../hooks/utils/postWithDelta";
 
 const BacktestChart = ({ ticker = "VAS.AX" }) => {
   const [backtestData, setBacktestData] = useState(null);
   const [error, setError] = useState(null);
+  // Last cursor and payload per ticker, so refetches only download what changed
+  const deltaCache = useRef(new Map());
 
   useEffect(() => {
     const fetchBacktestData = async () => {
       try {
-        const response = await fetch("http://localhost:5000/api/backtest", {
-          method: "POST",
-          headers: {
-            "Content-Type": "application/json",
-          },
-          body: JSON.stringify({ ticker, train_period: "5y", test_days: 30 }),
-        });
-        const data = await response.json();
-        if (response.ok) {
-          setBacktestData(data);
-        } else {
-          setError(data.error || "An error occurred while fetching data");
-        }
+        const data = await postWithDelta(
+          deltaCache.current,
+          "/api/backtest",
+          { ticker, train_period: "5y", test_days: 30 },
+          "An error occurred while fetching data"
+        );
+        setBacktestData(data);
       } catch (error) {
         setError(error.message);
       }
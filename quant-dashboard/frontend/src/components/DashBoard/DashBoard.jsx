@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from "react";
+import React, { useState, useEffect, useRef } from "react";
 import Header from "./Header";
 import MetricsGrid from "./MetricsGrid";
 import PriceChart from "./PriceChart";
@@ -6,6 +6,7 @@ import AIPredictionChart from "./AIPredictionChart";
 import BacktestChart from "./BacktestChart";
 import AnalysisSummary from "./AnalysisSummary";
 import { Activity, AlertCircle, Brain, History, Info } from "lucide-react";
+import postWithDelta from "../../hooks/utils/postWithDelta";
 
 const Dashboard = () => {
   // State management
@@ -22,24 +23,23 @@ const Dashboard = () => {
   const [backtestLoading, setBacktestLoading] = useState(false);
   const [backtestError, setBacktestError] = useState("");
   const [selectedModel, setSelectedModel] = useState(null);
+  // Last cursor and payload per request, so refreshes only download what changed
+  const deltaCache = useRef(new Map());
 
   const fetchData = async (selectedTicker = ticker) => {
     setLoading(true);
     setError("");
     try {
-      const response = await fetch("http://localhost:5000/api/analyze", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
+      const result = await postWithDelta(
+        deltaCache.current,
+        "/api/analyze",
+        {
           ticker: selectedTicker,
           monthly_target: monthlyTarget,
           total_target: totalTarget,
-        }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch market data");
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
+        },
+        "Failed to fetch market data"
+      );
 
       setData(result);
       setAiData(null);
@@ -58,15 +58,12 @@ const Dashboard = () => {
     setBacktestData(null);
     try {
       const endpoint = advanced ? "/api/predict-advanced" : "/api/predict";
-      const response = await fetch(`http://localhost:5000${endpoint}`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ ticker }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch AI prediction");
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
+      const result = await postWithDelta(
+        deltaCache.current,
+        endpoint,
+        { ticker },
+        "Failed to fetch AI prediction"
+      );
 
       setAiData(result);
       setSelectedModel(advanced ? "Advanced LSTM" : "Prophet");
@@ -86,15 +83,12 @@ const Dashboard = () => {
     setBacktestLoading(true);
     setBacktestError("");
     try {
-      const response = await fetch("http://localhost:5000/api/backtest", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ ticker }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch backtest results");
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
+      const result = await postWithDelta(
+        deltaCache.current,
+        "/api/backtest",
+        { ticker },
+        "Failed to fetch backtest results"
+      );
 
       setBacktestData(result);
     } catch (err) {
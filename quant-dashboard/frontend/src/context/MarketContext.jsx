@@ -1,6 +1,7 @@
 // src/context/MarketContext.jsx
 
-import React, { createContext, useContext, useState } from "react";
+import React, { createContext, useContext, useRef, useState } from "react";
+import postWithDelta from "../hooks/utils/postWithDelta";
 
 const MarketContext = createContext();
 
@@ -27,24 +28,23 @@ export const MarketProvider = ({ children }) => {
   const [backtestLoading, setBacktestLoading] = useState(false);
   const [backtestError, setBacktestError] = useState("");
   const [selectedModel, setSelectedModel] = useState(null);
+  // Last cursor and payload per request, so refreshes only download what changed
+  const deltaCache = useRef(new Map());
 
   const fetchData = async (selectedTicker = ticker) => {
     setLoading(true);
     setError("");
     try {
-      const response = await fetch("http://localhost:5000/api/analyze", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
+      const result = await postWithDelta(
+        deltaCache.current,
+        "/api/analyze",
+        {
           ticker: selectedTicker,
           monthly_target: monthlyTarget,
           total_target: totalTarget,
-        }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch market data");
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
+        },
+        "Failed to fetch market data"
+      );
 
       setData(result);
       setAiData(null);
@@ -63,15 +63,12 @@ export const MarketProvider = ({ children }) => {
     setBacktestData(null);
     try {
       const endpoint = advanced ? "/api/predict-advanced" : "/api/predict";
-      const response = await fetch(`http://localhost:5000${endpoint}`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ ticker }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch AI prediction");
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
+      const result = await postWithDelta(
+        deltaCache.current,
+        endpoint,
+        { ticker },
+        "Failed to fetch AI prediction"
+      );
 
       setAiData(result);
       setSelectedModel(advanced ? "Advanced LSTM" : "Prophet");
@@ -91,15 +88,12 @@ export const MarketProvider = ({ children }) => {
     setBacktestLoading(true);
     setBacktestError("");
     try {
-      const response = await fetch("http://localhost:5000/api/backtest", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ ticker }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch backtest results");
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
+      const result = await postWithDelta(
+        deltaCache.current,
+        "/api/backtest",
+        { ticker },
+        "Failed to fetch backtest results"
+      );
 
       setBacktestData(result);
     } catch (err) {
@@ -1,30 +1,25 @@
 // src/hooks/useBacktest.js
 
-import { useState } from "react";
+import { useRef, useState } from "react";
+import postWithDelta from "./utils/postWithDelta";
 
 const useBacktest = () => {
   const [backtestData, setBacktestData] = useState(null);
   const [backtestLoading, setBacktestLoading] = useState(false);
   const [backtestError, setBacktestError] = useState("");
+  // Last merged payload and cursor, so refreshes only download what changed
+  const deltaCache = useRef(new Map());
 
   const runBacktest = async (ticker) => {
     setBacktestLoading(true);
     setBacktestError("");
     try {
-      const response = await fetch("http://localhost:5000/api/backtest", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ ticker }),
-      });
-
-      if (!response.ok) {
-        throw new Error("Failed to fetch backtest results");
-      }
-
-      const result = await response.json();
-      if (result.error) {
-        throw new Error(result.error);
-      }
+      const result = await postWithDelta(
+        deltaCache.current,
+        "/api/backtest",
+        { ticker },
+        "Failed to fetch backtest results"
+      );
       setBacktestData(result);
     } catch (err) {
       setBacktestError(
@@ -1,31 +1,29 @@
 // src/hooks/useFetchData.js
 
-import { useState } from "react";
+import { useRef, useState } from "react";
+import postWithDelta from "./utils/postWithDelta";
 
 const useFetchData = () => {
   const [data, setData] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState("");
+  // Last merged payload and cursor, so refreshes only download what changed
+  const deltaCache = useRef(new Map());
 
   const fetchData = async (ticker, monthlyTarget, totalTarget) => {
     setLoading(true);
     setError("");
     try {
-      const response = await fetch("http://localhost:5000/api/analyze", {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({
+      const result = await postWithDelta(
+        deltaCache.current,
+        "/api/analyze",
+        {
           ticker,
           monthly_target: monthlyTarget,
           total_target: totalTarget,
-        }),
-      });
-
-      if (!response.ok) throw new Error("Failed to fetch data");
-
-      const result = await response.json();
-      if (result.error) throw new Error(result.error);
-
+        },
+        "Failed to fetch data"
+      );
       setData(result);
     } catch (err) {
       setError(err.message || "Error fetching data. Please try again.");
@@ -1,11 +1,14 @@
 // src/hooks/usePredictAI.js
 
-import { useState } from "react";
+import { useRef, useState } from "react";
+import postWithDelta from "./utils/postWithDelta";
 
 const usePredictAI = () => {
   const [aiData, setAiData] = useState(null);
   const [aiLoading, setAiLoading] = useState(false);
   const [aiError, setAiError] = useState("");
+  // Last merged payload and cursor, so refreshes only download what changed
+  const deltaCache = useRef(new Map());
 
   const predictAI = async (ticker) => {
     await handlePredict(ticker, false);
@@ -20,22 +23,12 @@ const usePredictAI = () => {
     setAiError("");
     try {
       const endpoint = advanced ? "/api/predict-advanced" : "/api/predict";
-      const response = await fetch(`http://localhost:5000${endpoint}`, {
-        method: "POST",
-        headers: { "Content-Type": "application/json" },
-        body: JSON.stringify({ ticker }),
-      });
-
-      if (!response.ok) {
-        throw new Error(
-          `Failed to fetch ${advanced ? "advanced " : ""}AI prediction`
-        );
-      }
-
-      const result = await response.json();
-      if (result.error) {
-        throw new Error(result.error);
-      }
+      const result = await postWithDelta(
+        deltaCache.current,
+        endpoint,
+        { ticker },
+        `Failed to fetch ${advanced ? "advanced " : ""}AI prediction`
+      );
       setAiData(result.forecast);
     } catch (err) {
       setAiError(
@@ -0,0 +1,52 @@
+// src/hooks/utils/applyDelta.js
+
+const isObject = (value) =>
+  value !== null && typeof value === "object" && !Array.isArray(value);
+
+const mergeChanges = (target, changes) => {
+  const merged = { ...target };
+  Object.entries(changes).forEach(([key, value]) => {
+    merged[key] =
+      isObject(value) && isObject(target[key])
+        ? mergeChanges(target[key], value)
+        : value;
+  });
+  return merged;
+};
+
+const removePaths = (target, paths) => {
+  const removed = { ...target };
+  paths.forEach(([key, ...rest]) => {
+    if (!(key in removed)) return;
+    if (rest.length === 0) {
+      delete removed[key];
+    } else if (isObject(removed[key])) {
+      removed[key] = removePaths(removed[key], [rest]);
+    }
+  });
+  return removed;
+};
+
+// Rebuild a series in the order of `keys`: rows not listed there are dropped,
+// and `records` replace or add rows.
+const mergeSeries = (rows = [], { key, keys, records }) => {
+  const byKey = new Map(rows.map((row) => [row[key], row]));
+  records.forEach((row) => byKey.set(row[key], row));
+  return keys.map((rowKey) => byKey.get(rowKey)).filter(Boolean);
+};
+
+// Merge an API response into the previous payload. Full responses
+// (delta: false) replace it; delta responses only carry changed values,
+// removed key paths and the new or changed rows of each series.
+const applyDelta = (previous, response) => {
+  const { cursor, delta, changes, removed, series, ...payload } = response;
+  if (!delta || !previous) return payload;
+
+  const merged = removePaths(mergeChanges(previous, changes), removed);
+  Object.entries(series).forEach(([name, update]) => {
+    merged[name] = mergeSeries(previous[name], update);
+  });
+  return merged;
+};
+
+export default applyDelta;
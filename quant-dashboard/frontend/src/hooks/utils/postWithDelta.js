@@ -0,0 +1,31 @@
+// src/hooks/utils/postWithDelta.js
+
+import applyDelta from "./applyDelta";
+
+const API_URL = "http://localhost:5000";
+
+// POST to a delta-enabled endpoint and return the full merged payload.
+// `cache` is a Map (kept in a ref by the caller) holding the last cursor and
+// payload per endpoint and parameter set, so repeated requests only download
+// what changed.
+const postWithDelta = async (cache, endpoint, params, errorMessage) => {
+  const key = JSON.stringify([endpoint, params]);
+  const previous = cache.get(key);
+
+  const response = await fetch(`${API_URL}${endpoint}`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ ...params, cursor: previous?.cursor }),
+  });
+
+  const result = await response.json().catch(() => null);
+  if (!response.ok || !result || result.error) {
+    throw new Error(result?.error || errorMessage);
+  }
+
+  const payload = applyDelta(previous?.payload, result);
+  cache.set(key, { cursor: result.cursor, payload });
+  return payload;
+};
+
+export default postWithDelta;